@@ -220,3 +220,8 @@ config.USING_SVML = _try_enable_svml()
 # SVML state to "no SVML". See https://github.com/numba/numba/issues/4689 for
 # context.
 # ---------------------- WARNING WARNING WARNING ----------------------------
+
+# Optionally get the threading layer going while the user's program starts up
+if config.PARALLEL_PRELOAD:
+    from numba.np.ufunc.parallel import _preload_threads
+    _preload_threads()
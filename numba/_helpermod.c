@@ -132,6 +132,8 @@ build_c_helpers_dict(void)
     /* for dictionary support */
     declmethod(test_dict);
     declmethod(dict_new_minsize);
+    declmethod(dict_new_sized);
+    declmethod(dict_copy);
     declmethod(dict_set_method_table);
     declmethod(dict_free);
     declmethod(dict_length);
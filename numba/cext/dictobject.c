@@ -411,14 +411,51 @@ zero_val(NB_DictKeys *dk, char *data){
     memset(data, 0, dk->val_size);
 }
 
+/* Copy *size* bytes from *src* to *dst*.
+ * The common primitive sizes use a constant-size memcpy, which the
+ * compiler lowers to a single load/store instead of a library call.
+ */
+static inline void
+copy_bytes(char *dst, const char *src, Py_ssize_t size){
+    switch (size) {
+    case 1: memcpy(dst, src, 1); break;
+    case 2: memcpy(dst, src, 2); break;
+    case 4: memcpy(dst, src, 4); break;
+    case 8: memcpy(dst, src, 8); break;
+    case 16: memcpy(dst, src, 16); break;
+    default: memcpy(dst, src, size);
+    }
+}
+
+/* Bytewise equality of *size* bytes, specialized like copy_bytes() */
+static inline int
+equal_bytes(const char *lhs, const char *rhs, Py_ssize_t size){
+    switch (size) {
+    case 4: {
+        uint32_t a, b;
+        memcpy(&a, lhs, 4);
+        memcpy(&b, rhs, 4);
+        return a == b;
+    }
+    case 8: {
+        uint64_t a, b;
+        memcpy(&a, lhs, 8);
+        memcpy(&b, rhs, 8);
+        return a == b;
+    }
+    default:
+        return memcmp(lhs, rhs, size) == 0;
+    }
+}
+
 static void
 copy_key(NB_DictKeys *dk, char *dst, const char *src){
-    memcpy(dst, src, dk->key_size);
+    copy_bytes(dst, src, dk->key_size);
 }
 
 static void
 copy_val(NB_DictKeys *dk, char *dst, const char *src){
-    memcpy(dst, src, dk->val_size);
+    copy_bytes(dst, src, dk->val_size);
 }
 
 /* Returns -1 for error; 0 for not equal; 1 for equal */
@@ -427,7 +464,7 @@ key_equal(NB_DictKeys *dk, const char *lhs, const char *rhs) {
     if ( dk->methods.key_equal ) {
         return dk->methods.key_equal(lhs, rhs);
     } else {
-        return memcmp(lhs, rhs, dk->key_size) == 0;
+        return equal_bytes(lhs, rhs, dk->key_size);
     }
 }
 
@@ -1011,6 +1048,65 @@ numba_dict_new_minsize(NB_Dict **out, Py_ssize_t key_size, Py_ssize_t val_size)
     return numba_dict_new(out, D_MINSIZE, key_size, val_size);
 }
 
+int
+numba_dict_new_sized(NB_Dict **out, Py_ssize_t n_keys, Py_ssize_t key_size, Py_ssize_t val_size)
+{
+    Py_ssize_t size;
+
+    /* Find the smallest table size that holds n_keys without resizing. */
+    for (size = D_MINSIZE; USABLE_FRACTION(size) < n_keys; size <<= 1) {
+        if (size > PY_SSIZE_T_MAX / 4) {
+            return ERR_NO_MEMORY;
+        }
+    }
+    return numba_dict_new(out, size, key_size, val_size);
+}
+
+int
+numba_dict_copy(NB_Dict **out, NB_Dict *d)
+{
+    NB_DictKeys *dk = d->keys;
+    NB_DictKeys *newdk;
+    NB_Dict *newd;
+    NB_DictEntry *ep;
+    Py_ssize_t i;
+    int status;
+
+    status = numba_dict_new(&newd, dk->size, dk->key_size, dk->val_size);
+    if (status != OK) return status;
+    newdk = newd->keys;
+
+    /* The tables have the same size, so the indices and the entries can be
+     * copied in one block instead of reinserting every item.
+     */
+    memcpy(newdk->indices, dk->indices,
+           dk->entry_offset + dk->entry_size * USABLE_FRACTION(dk->size));
+    memcpy(&newdk->methods, &dk->methods, sizeof(type_based_methods_table));
+    newdk->usable = dk->usable;
+    newdk->nentries = dk->nentries;
+    newd->used = d->used;
+
+    /* The copy owns new references to all live keys and values */
+    for (i = 0; i < newdk->nentries; i++) {
+        ep = get_entry(newdk, i);
+        if (ep->hash != DKIX_EMPTY) {
+            dk_incref_key(newdk, entry_get_key(newdk, ep));
+            dk_incref_val(newdk, entry_get_val(newdk, ep));
+        }
+    }
+
+    /* Like CPython, compact the copy if too many entries were deleted */
+    if (newd->used < (newdk->nentries * 2) / 3) {
+        status = numba_dict_resize(newd, D_GROWTH_RATE(newd));
+        if (status != OK) {
+            numba_dict_free(newd);
+            return status;
+        }
+    }
+    *out = newd;
+    return OK;
+}
+
 void
 numba_dict_set_method_table(NB_Dict *d, type_based_methods_table *methods)
 {
@@ -1027,13 +1123,15 @@ numba_dict_set_method_table(NB_Dict *d, type_based_methods_table *methods)
 
 int
 numba_test_dict(void) {
-    NB_Dict *d;
+    NB_Dict *d, *d2;
     int status;
     Py_ssize_t ix;
     Py_ssize_t usable;
     Py_ssize_t it_count;
     const char *it_key, *it_val;
     NB_DictIter iter;
+    int32_t k;
+    int64_t v;
 
 #if defined(_MSC_VER)
     /* So that VS2008 compiler is happy */
@@ -1184,6 +1282,85 @@ numba_test_dict(void) {
     CHECK(d->used == it_count);
 
     numba_dict_free(d);
+
+    // Test preallocated sizes
+    status = numba_dict_new_sized(&d, 0, 4, 8);
+    CHECK(status == OK);
+    CHECK(d->keys->size == D_MINSIZE);
+    numba_dict_free(d);
+
+    status = numba_dict_new_sized(&d, USABLE_FRACTION(D_MINSIZE) + 1, 4, 8);
+    CHECK(status == OK);
+    CHECK(d->keys->size == D_MINSIZE * 2);
+    numba_dict_free(d);
+
+    status = numba_dict_new_sized(&d, 100, 4, 8);
+    CHECK(status == OK);
+    CHECK(d->keys->size == 256);
+    CHECK(d->keys->usable >= 100);
+    numba_dict_free(d);
+
+    status = numba_dict_new_sized(&d, PY_SSIZE_T_MAX, 4, 8);
+    CHECK(status == ERR_NO_MEMORY);
+
+    // Test copying, with and without deleted entries
+    status = numba_dict_new(&d, D_MINSIZE, 4, 8);
+    CHECK(status == OK);
+    for (k = 0; k < 5; ++k) {
+        v = k * 10;
+        status = numba_dict_insert(d, (const char*)&k, k,
+                                   (const char*)&v, got_value);
+        CHECK(status == OK);
+    }
+    status = numba_dict_copy(&d2, d);
+    CHECK(status == OK);
+    CHECK(d2->used == 5);
+    CHECK(d2->keys->size == d->keys->size);
+    for (k = 0; k < 5; ++k) {
+        ix = numba_dict_lookup(d2, (const char*)&k, k, got_value);
+        CHECK(ix == k);
+        memcpy(&v, got_value, 8);
+        CHECK(v == k * 10);
+    }
+    numba_dict_free(d2);
+
+    for (k = 0; k < 4; ++k) {
+        ix = numba_dict_lookup(d, (const char*)&k, k, got_value);
+        CHECK(numba_dict_delitem(d, k, ix) == OK);
+    }
+    status = numba_dict_copy(&d2, d);
+    CHECK(status == OK);
+    CHECK(d2->used == 1);
+    CHECK(d2->keys->nentries == 1);
+    k = 4;
+    ix = numba_dict_lookup(d2, (const char*)&k, k, got_value);
+    CHECK(ix == 0);
+    memcpy(&v, got_value, 8);
+    CHECK(v == 40);
+    numba_dict_free(d2);
+    numba_dict_free(d);
+
+    // Test long collision chains
+    status = numba_dict_new(&d, D_MINSIZE, 4, 8);
+    CHECK(status == OK);
+    for (k = 0; k < 60; ++k) {
+        v = k * 10;
+        status = numba_dict_insert(d, (const char*)&k, 0xbeef,
+                                   (const char*)&v, got_value);
+        CHECK(status == OK);
+    }
+    CHECK(d->used == 60);
+    for (k = 0; k < 60; ++k) {
+        ix = numba_dict_lookup(d, (const char*)&k, 0xbeef, got_value);
+        CHECK(ix == k);
+        memcpy(&v, got_value, 8);
+        CHECK(v == k * 10);
+    }
+    k = -1;
+    ix = numba_dict_lookup(d, (const char*)&k, 0xbeef, got_value);
+    CHECK(ix == DKIX_EMPTY);
+    numba_dict_free(d);
+
     return 0;
 
 }
@@ -105,6 +105,17 @@ See numba_dict_new().
 NUMBA_EXPORT_FUNC(int)
 numba_dict_new_minsize(NB_Dict **out, Py_ssize_t key_size, Py_ssize_t val_size);
 
+/* Allocates a new dict with enough capacity for *n_keys* items
+See numba_dict_new().
+*/
+NUMBA_EXPORT_FUNC(int)
+numba_dict_new_sized(NB_Dict **out, Py_ssize_t n_keys, Py_ssize_t key_size, Py_ssize_t val_size);
+
+/* Allocates a new dict holding the same items as *d*
+*/
+NUMBA_EXPORT_FUNC(int)
+numba_dict_copy(NB_Dict **out, NB_Dict *d);
+
 /* Set the method table for type specific operations
 */
 NUMBA_EXPORT_FUNC(void)
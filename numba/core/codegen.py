@@ -718,7 +718,10 @@ class CPUCodeLibrary(CodeLibrary):
 
     def add_linking_library(self, library):
         library._ensure_finalized()
-        self._linking_libraries.append(library)
+        # Wrappers often request the same library more than once (directly
+        # and through the library they wrap); only link each in once.
+        if library not in self._linking_libraries:
+            self._linking_libraries.append(library)
 
     def add_ir_module(self, ir_module):
         self._raise_if_finalized()
@@ -749,13 +752,10 @@ class CPUCodeLibrary(CodeLibrary):
                  self.get_llvm_str(), 'llvm')
 
         # Link libraries for shared code
-        seen = set()
         for library in self._linking_libraries:
-            if library not in seen:
-                seen.add(library)
-                self._final_module.link_in(
-                    library._get_module_for_linking(), preserve=True,
-                )
+            self._final_module.link_in(
+                library._get_module_for_linking(), preserve=True,
+            )
 
         # Optimize the module after all dependences are linked in above,
         # to allow for inlining.
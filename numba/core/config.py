@@ -355,6 +355,13 @@ class _EnvReloader(object):
         )
         THREADING_LAYER = _readenv("NUMBA_THREADING_LAYER", str, 'default')
 
+        # parallel ufuncs called on fewer elements than this run serially
+        PARALLEL_UFUNC_THRESHOLD = _readenv("NUMBA_PARALLEL_UFUNC_THRESHOLD",
+                                            int, 512)
+
+        # start the threading layer in the background when numba is imported
+        PARALLEL_PRELOAD = _readenv("NUMBA_PARALLEL_PRELOAD", int, 0)
+
         CAPTURED_ERRORS = _readenv("NUMBA_CAPTURED_ERRORS",
                                    _validate_captured_errors_style,
                                    'old_style')
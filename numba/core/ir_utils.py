@@ -908,24 +908,22 @@ def copy_propagate(blocks, typemap):
     c_data = init_copy_propagate_data(blocks, entry, typemap)
     (gen_copies, all_copies, kill_copies, in_copies, out_copies) = c_data
 
-    old_point = None
-    new_point = copy.deepcopy(out_copies)
-    # comparison works since dictionary of built-in types
-    while old_point != new_point:
-        for label in blocks.keys():
-            if label == entry:
-                continue
-            predecs = [i for i, _d in cfg.predecessors(label)]
+    predecessors = {label: [i for i, _d in cfg.predecessors(label)]
+                    for label in blocks.keys() if label != entry}
+    changed = True
+    while changed:
+        changed = False
+        for label, predecs in predecessors.items():
             # in_b =  intersect(predec(B))
-            in_copies[label] = out_copies[predecs[0]].copy()
-            for p in predecs:
-                in_copies[label] &= out_copies[p]
+            in_copies[label] = out_copies[predecs[0]].intersection(
+                *(out_copies[p] for p in predecs[1:]))
 
             # out_b = gen_b | (in_b - kill_b)
-            out_copies[label] = (gen_copies[label]
-                                 | (in_copies[label] - kill_copies[label]))
-        old_point = new_point
-        new_point = copy.deepcopy(out_copies)
+            new_out = (gen_copies[label]
+                       | (in_copies[label] - kill_copies[label]))
+            if new_out != out_copies[label]:
+                out_copies[label] = new_out
+                changed = True
     if config.DEBUG_ARRAY_OPT >= 1:
         print("copy propagate out_copies:", out_copies)
     return in_copies, out_copies
@@ -944,12 +942,12 @@ def init_copy_propagate_data(blocks, entry, typemap):
     kill_copies = {}
     for label, gen_set in gen_copies.items():
         kill_copies[label] = set()
+        assigned = {lhs for lhs, rhs in gen_set}
         for lhs, rhs in all_copies:
             if lhs in extra_kill[label] or rhs in extra_kill[label]:
                 kill_copies[label].add((lhs, rhs))
             # a copy is killed if it is not in this block and lhs or rhs are
             # assigned in this block
-            assigned = {lhs for lhs, rhs in gen_set}
             if ((lhs, rhs) not in gen_set
                     and (lhs in assigned or rhs in assigned)):
                 kill_copies[label].add((lhs, rhs))
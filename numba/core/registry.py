@@ -93,10 +93,16 @@ class DelayedRegistry(utils.UniqueDict):
         super(DelayedRegistry, self).__init__(*args, **kws)
 
     def __getitem__(self, item):
-        if item in self.ondemand:
-            self[item] = self.ondemand[item]()
-            del self.ondemand[item]
-        return super(DelayedRegistry, self).__getitem__(item)
+        try:
+            return super(DelayedRegistry, self).__getitem__(item)
+        except KeyError:
+            # Not initialised yet, is there a deferred value?
+            if item not in self.ondemand:
+                raise
+        value = self.ondemand[item]()
+        self[item] = value
+        del self.ondemand[item]
+        return value
 
     def __setitem__(self, key, value):
         if self._type_check:
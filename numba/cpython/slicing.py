@@ -2,7 +2,7 @@
 Implement slices and various slice computations.
 """
 
-from itertools import zip_longest
+import functools
 
 from llvmlite import ir
 from numba.core import cgutils, types, typing, utils
@@ -34,28 +34,23 @@ def fix_slice(builder, slice, size):
     def fix_bound(bound_name, lower_repl, upper_repl):
         bound = getattr(slice, bound_name)
         bound = fix_index(builder, bound, size)
-        # Store value
-        setattr(slice, bound_name, bound)
         # Still negative? => clamp to lower_repl
         underflow = builder.icmp_signed('<', bound, zero)
-        with builder.if_then(underflow, likely=False):
-            setattr(slice, bound_name, lower_repl)
         # Greater than size? => clamp to upper_repl
         overflow = builder.icmp_signed('>=', bound, size)
-        with builder.if_then(overflow, likely=False):
-            setattr(slice, bound_name, upper_repl)
-
-    with builder.if_else(cgutils.is_neg_int(builder, slice.step)) as (if_neg_step, if_pos_step):
-        with if_pos_step:
-            # < 0 => 0; >= size => size
-            fix_bound('start', zero, size)
-            fix_bound('stop', zero, size)
-        with if_neg_step:
-            # < 0 => -1; >= size => size - 1
-            lower = minus_one
-            upper = builder.add(size, minus_one)
-            fix_bound('start', lower, upper)
-            fix_bound('stop', lower, upper)
+        # Selects rather than branches keep the clamping straight-line code
+        bound = builder.select(underflow, lower_repl, bound)
+        bound = builder.select(overflow, upper_repl, bound)
+        # Store value
+        setattr(slice, bound_name, bound)
+
+    # Positive step: < 0 => 0; >= size => size
+    # Negative step: < 0 => -1; >= size => size - 1
+    is_neg_step = cgutils.is_neg_int(builder, slice.step)
+    lower = builder.select(is_neg_step, minus_one, zero)
+    upper = builder.select(is_neg_step, builder.add(size, minus_one), size)
+    fix_bound('start', lower, upper)
+    fix_bound('stop', lower, upper)
 
 
 def get_slice_length(builder, slicestruct):
@@ -145,6 +140,24 @@ def get_defaults(context):
     return (0, maxint, maxint, - maxint - 1, 1)
 
 
+@functools.lru_cache(maxsize=None)
+def _get_default_constants(intp_t):
+    """
+    Build the LLVM constants for get_default_constants().  They only depend
+    on the intp type, so they are built once per type and shared.
+    """
+    maxint = (1 << (intp_t.width - 1)) - 1
+    return tuple(ir.Constant(intp_t, x)
+                 for x in (0, maxint, maxint, - maxint - 1, 1))
+
+
+def get_default_constants(context):
+    """
+    Like get_defaults(), but as intp LLVM constants.
+    """
+    return _get_default_constants(context.get_value_type(types.intp))
+
+
 #---------------------------------------------------------------------------
 # The slice structure
 
@@ -156,7 +169,7 @@ def slice_constructor_impl(context, builder, sig, args):
         default_stop_pos,
         default_stop_neg,
         default_step,
-    ) = [context.get_constant(types.intp, x) for x in get_defaults(context)]
+    ) = get_default_constants(context)
 
     slice_args = [None] * 3
 
@@ -250,7 +263,7 @@ def make_slice_from_constant(context, builder, ty, pyval):
         default_stop_pos,
         default_stop_neg,
         default_step,
-    ) = [context.get_constant(types.intp, x) for x in get_defaults(context)]
+    ) = get_default_constants(context)
 
     step = pyval.step
     if step is None:
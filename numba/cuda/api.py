@@ -452,14 +452,15 @@ def _auto_device(ary, stream=0, copy=True):
     return devicearray.auto_device(ary, stream=stream, copy=copy)
 
 
-def detect():
+def detect(file=None):
     """
     Detect supported CUDA hardware and print a summary of the detected hardware.
 
     Returns a boolean indicating whether any supported devices were detected.
+    The summary is written to *file* (``sys.stdout`` by default).
     """
     devlist = list_devices()
-    print('Found %d CUDA devices' % len(devlist))
+    print('Found %d CUDA devices' % len(devlist), file=file)
     supported_count = 0
     for dev in devlist:
         attrs = []
@@ -484,12 +485,14 @@ def detect():
             support = '[SUPPORTED]'
             supported_count += 1
 
-        print('id %d    %20s %40s' % (dev.id, dev.name, support))
+        print('id %d    %20s %40s' % (dev.id, dev.name, support),
+              file=file)
         for key, val in attrs:
-            print('%40s: %s' % (key, val))
+            print('%40s: %s' % (key, val), file=file)
 
-    print('Summary:')
-    print('\t%d/%d devices are supported' % (supported_count, len(devlist)))
+    print('Summary:', file=file)
+    print('\t%d/%d devices are supported' % (supported_count, len(devlist)),
+          file=file)
     return supported_count > 0
 
 
@@ -75,8 +75,9 @@ def _get_source_variable(lib):
         return get_cuda_paths()['cudalib_dir'].by
 
 
-def test(_platform=None, print_paths=True):
-    """Test library lookup.  Path info is printed to stdout.
+def test(_platform=None, print_paths=True, file=None):
+    """Test library lookup.  Path info is printed to *file* (``sys.stdout``
+    by default).
     """
     failed = False
 
@@ -84,44 +85,47 @@ def test(_platform=None, print_paths=True):
     libs = 'nvvm cudart'.split()
     for lib in libs:
         path = get_cudalib(lib, _platform)
-        print('Finding {} from {}'.format(lib, _get_source_variable(lib)))
+        print('Finding {} from {}'.format(lib, _get_source_variable(lib)),
+              file=file)
         if print_paths:
-            print('\tlocated at', path)
+            print('\tlocated at', path, file=file)
         else:
-            print('\tnamed ', os.path.basename(path))
+            print('\tnamed ', os.path.basename(path), file=file)
 
         if _platform in (None, sys.platform):
             try:
-                print('\ttrying to open library', end='...')
+                print('\ttrying to open library', end='...', file=file)
                 open_cudalib(lib)
-                print('\tok')
+                print('\tok', file=file)
             except OSError as e:
-                print('\tERROR: failed to open %s:\n%s' % (lib, e))
+                print('\tERROR: failed to open %s:\n%s' % (lib, e),
+                      file=file)
                 failed = True
 
     # Check for cudadevrt (the only static library)
     lib = 'cudadevrt'
     path = get_cudalib(lib, _platform, static=True)
-    print('Finding {} from {}'.format(lib, _get_source_variable(lib)))
+    print('Finding {} from {}'.format(lib, _get_source_variable(lib)),
+          file=file)
     if print_paths:
-        print('\tlocated at', path)
+        print('\tlocated at', path, file=file)
     else:
-        print('\tnamed ', os.path.basename(path))
+        print('\tnamed ', os.path.basename(path), file=file)
 
     try:
         check_static_lib(lib)
     except FileNotFoundError as e:
-        print('\tERROR: failed to find %s:\n%s' % (lib, e))
+        print('\tERROR: failed to find %s:\n%s' % (lib, e), file=file)
         failed = True
 
     # Check for libdevice
     where = _get_source_variable('libdevice')
-    print(f'Finding libdevice from {where}')
-    print('\ttrying to open library', end='...')
+    print(f'Finding libdevice from {where}', file=file)
+    print('\ttrying to open library', end='...', file=file)
     path = get_libdevice()
     if path:
-        print('\tok')
+        print('\tok', file=file)
     else:
-        print('\tERROR: can\'t open libdevice')
+        print('\tERROR: can\'t open libdevice', file=file)
         failed = True
     return not failed
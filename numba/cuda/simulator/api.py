@@ -41,10 +41,10 @@ def declare_device(*args, **kwargs):
     pass
 
 
-def detect():
-    print('Found 1 CUDA devices')
-    print('id %d    %20s %40s' % (0, 'SIMULATOR', '[SUPPORTED]'))
-    print('%40s: 5.3' % 'compute capability')
+def detect(file=None):
+    print('Found 1 CUDA devices', file=file)
+    print('id %d    %20s %40s' % (0, 'SIMULATOR', '[SUPPORTED]'), file=file)
+    print('%40s: 5.3' % 'compute capability', file=file)
 
 
 def list_devices():
@@ -2,6 +2,7 @@ import os
 import sys
 import subprocess
 import threading
+from io import StringIO
 from numba import cuda
 from numba.cuda.testing import (unittest, CUDATestCase, skip_on_cudasim,
                                 skip_under_cuda_memcheck)
@@ -17,6 +18,16 @@ class TestCudaDetect(CUDATestCase):
         self.assertIn('Found', output)
         self.assertIn('CUDA devices', output)
 
+    def test_cuda_detect_file(self):
+        # output goes to the given stream rather than stdout
+        buf = StringIO()
+        with captured_stdout() as out:
+            cuda.detect(file=buf)
+        self.assertEqual(out.getvalue(), '')
+        output = buf.getvalue()
+        self.assertIn('Found', output)
+        self.assertIn('CUDA devices', output)
+
 
 @skip_under_cuda_memcheck('Hangs cuda-memcheck')
 class TestCUDAFindLibs(CUDATestCase):
@@ -12,9 +12,17 @@ from numba import cuda
 def fib1(n):
     if n < 2:
         return n
+    if n == 2:
+        return 1
+    # Fast doubling: F(2k) = F(k) * (2 * F(k + 1) - F(k)) and
+    # F(2k + 1) = F(k) ** 2 + F(k + 1) ** 2
     # Note the second call does not use a named argument, unlike the CPU target
     # usecase
-    return fib1(n - 1) + fib1(n - 2)
+    a = fib1(n >> 1)
+    b = fib1((n >> 1) + 1)
+    if n & 1:
+        return a * a + b * b
+    return a * (2 * b - a)
 
 
 def make_fib2():
@@ -22,7 +30,15 @@ def make_fib2():
     def fib2(n):
         if n < 2:
             return n
-        return fib2(n - 1) + fib2(n - 2)
+        if n == 2:
+            return 1
+        # Fast doubling: F(2k) = F(k) * (2 * F(k + 1) - F(k)) and
+        # F(2k + 1) = F(k) ** 2 + F(k + 1) ** 2
+        a = fib2(n >> 1)
+        b = fib2((n >> 1) + 1)
+        if n & 1:
+            return a * a + b * b
+        return a * (2 * b - a)
 
     return fib2
 
@@ -43,8 +59,15 @@ def type_change_self(x, y):
 def fib3(n):
     if n < 2:
         return n
-
-    return fib3(n - 1) + fib3(n - 2)
+    if n == 2:
+        return 1
+    # Fast doubling: F(2k) = F(k) * (2 * F(k + 1) - F(k)) and
+    # F(2k + 1) = F(k) ** 2 + F(k + 1) ** 2
+    a = fib3(n >> 1)
+    b = fib3((n >> 1) + 1)
+    if n & 1:
+        return a * a + b * b
+    return a * (2 * b - a)
 
 
 # Run-away self recursion
@@ -5,7 +5,6 @@ import os
 import platform
 import textwrap
 import sys
-from contextlib import redirect_stdout
 from datetime import datetime
 from io import StringIO
 from subprocess import check_output, PIPE, CalledProcessError
@@ -220,12 +219,19 @@ def get_os_spec_info(os_name):
     # Extract (k, output) pairs by searching for keywords in output
     kwds = params.get('kwds', {})
     for line in output:
-        match = kwds.keys() & line.split()
-        if match and len(match) == 1:
-            k = kwds[match.pop()]
-            os_spec_info[k] = line
-        elif len(match) > 1:
-            print(f'Ambiguous output: {line}')
+        # Scan the tokens directly rather than building a set intersection
+        # per line; most lines contain no keyword at all.
+        match = None
+        for tok in line.split():
+            if tok not in kwds or tok == match:
+                continue
+            if match is not None:
+                print(f'Ambiguous output: {line}')
+                match = None
+                break
+            match = tok
+        if match is not None:
+            os_spec_info[kwds[match]] = line
 
     # Try to extract something meaningful from output string
     def format():
@@ -355,8 +361,7 @@ def get_sysinfo():
             sys_info[_cu_dev_init] = True
 
             output = StringIO()
-            with redirect_stdout(output):
-                cu.detect()
+            cu.detect(file=output)
             sys_info[_cu_detect_out] = output.getvalue()
             output.close()
 
@@ -364,8 +369,7 @@ def get_sysinfo():
             sys_info[_cu_rt_ver] = '%s.%s' % curuntime.get_version()
 
             output = StringIO()
-            with redirect_stdout(output):
-                cudadrv.libs.test(sys.platform, print_paths=False)
+            cudadrv.libs.test(sys.platform, print_paths=False, file=output)
             sys_info[_cu_lib_test] = output.getvalue()
             output.close()
 
@@ -10,9 +10,13 @@ UFuncCore also defines a work-stealing mechanism that allows idle threads
 to steal works from other threads.
 """
 
+import functools
+import hashlib
 import os
 import sys
+import threading
 import warnings
+from collections import namedtuple
 from threading import RLock as threadRLock
 from ctypes import CFUNCTYPE, c_int, CDLL, POINTER, c_uint
 
@@ -45,8 +49,46 @@ def get_thread_count():
 
 NUM_THREADS = get_thread_count()
 
+# NumPy dtype numbers of the Numba types seen by the ufunc builders
+_dtype_nums = {}
 
-def build_gufunc_kernel(library, ctx, info, sig, inner_ndim):
+
+def _get_dtype_num(ty):
+    """
+    Return the NumPy dtype number corresponding to Numba type *ty*.
+    """
+    try:
+        return _dtype_nums[ty]
+    except KeyError:
+        num = _dtype_nums[ty] = as_dtype(ty).num
+        return num
+
+
+_kernel_types = namedtuple('_kernel_types',
+                           ['byte_ptr_t', 'kernel_fnty', 'parallel_for_fnty'])
+
+
+@functools.lru_cache(maxsize=None)
+def _get_kernel_types(intp_t):
+    """
+    Return the LLVM types used by build_gufunc_kernel() for the given intp
+    type. They only depend on the latter, so they are built once and shared.
+    """
+    byte_ptr_t = ir.PointerType(ir.IntType(8))
+    intp_ptr_t = ir.PointerType(intp_t)
+    # Both the wrapper and the inner function it calls have the signature
+    # void kernel(char **args, npy_intp *dimensions, npy_intp* steps,
+    #             void* data)
+    kernel_fnty = ir.FunctionType(ir.VoidType(),
+                                  [ir.PointerType(byte_ptr_t), intp_ptr_t,
+                                   intp_ptr_t, byte_ptr_t])
+    parallel_for_fnty = ir.FunctionType(ir.VoidType(),
+                                        [byte_ptr_t] * 5 + [intp_t, ] * 3)
+    return _kernel_types(byte_ptr_t, kernel_fnty, parallel_for_fnty)
+
+
+def build_gufunc_kernel(library, ctx, info, sig, inner_ndim,
+                        serial_threshold=0):
     """Wrap the original CPU ufunc/gufunc with a parallel dispatcher.
     This function will wrap gufuncs and ufuncs something like.
 
@@ -65,6 +107,11 @@ def build_gufunc_kernel(library, ctx, info, sig, inner_ndim):
         inner dimension of the gufunc (this is len(sig.args) in the case of a
         ufunc)
 
+    serial_threshold
+        if the outer loop count (dimensions[0]) is below this value the inner
+        function is called directly on the calling thread, as dispatching to
+        the thread pool costs more than it saves. 0 disables this.
+
     Returns
     -------
     wrapper_info : (library, env, name)
@@ -95,22 +142,28 @@ def build_gufunc_kernel(library, ctx, info, sig, inner_ndim):
     choose to ignore it (TBB)!
     """
     assert isinstance(info, tuple)  # guard against old usage
-    # Declare types and function
-    byte_t = ir.IntType(8)
-    byte_ptr_t = ir.PointerType(byte_t)
-    byte_ptr_ptr_t = ir.PointerType(byte_ptr_t)
+    # The kernel is fully determined by the inner function, its environment
+    # and the dispatch shape. Name it from a digest of these (rather than an
+    # object id) so that it is stable across runs.
+    key = (info.env.env_name, info.name, str(sig), inner_ndim,
+           serial_threshold)
+    digest = hashlib.sha1(repr(key).encode()).hexdigest()[:16]
 
+    # Declare types and function
     intp_t = ctx.get_value_type(types.intp)
-    intp_ptr_t = ir.PointerType(intp_t)
+    byte_ptr_t, fnty, parallel_for_ty = _get_kernel_types(intp_t)
 
-    fnty = ir.FunctionType(ir.VoidType(), [ir.PointerType(byte_ptr_t),
-                                           ir.PointerType(intp_t),
-                                           ir.PointerType(intp_t),
-                                           byte_ptr_t])
     wrapperlib = ctx.codegen().create_library('parallelgufuncwrapper')
     mod = wrapperlib.create_ir_module('parallel.gufunc.wrapper')
-    kernel_name = ".kernel.{}_{}".format(id(info.env), info.name)
+    kernel_name = ".kernel.{}_{}".format(digest, info.name)
     lfunc = ir.Function(mod, fnty, name=kernel_name)
+    # The wrapper never unwinds nor calls itself, and the ufunc loop arguments
+    # are distinct buffers that are only used for the duration of the call.
+    lfunc.attributes.add('nounwind')
+    lfunc.attributes.add('norecurse')
+    for arg in lfunc.args:
+        arg.add_attribute('noalias')
+        arg.add_attribute('nocapture')
 
     bb_entry = lfunc.append_basic_block('')
 
@@ -119,9 +172,27 @@ def build_gufunc_kernel(library, ctx, info, sig, inner_ndim):
 
     args, dimensions, steps, data = lfunc.args
 
+    # Reference inner-function and link
+    tmp_voidptr = cgutils.get_or_insert_function(mod, fnty, info.name)
+    wrapperlib.add_linking_library(info.library)
+
+    if serial_threshold > 0:
+        # Small workload: run it on this thread, with no GIL handling either
+        # (the inner function acquires the GIL itself if it has to raise).
+        loopcount = builder.load(dimensions)
+        is_small = builder.icmp_signed('<', loopcount,
+                                       intp_t(serial_threshold))
+        with builder.if_then(is_small):
+            builder.call(tmp_voidptr, [args, dimensions, steps, data])
+            builder.ret_void()
+
     # Release the GIL (and ensure we have the GIL)
     # Note: numpy ufunc may not always release the GIL; thus,
     #       we need to ensure we have the GIL.
+    # Note: this must happen even for nopython inner functions. Their error
+    #       path re-acquires the GIL on a worker thread to set the exception,
+    #       which would deadlock against this thread holding the GIL while it
+    #       waits in numba_parallel_for.
     pyapi = ctx.get_python_api(builder)
     gil_state = pyapi.gil_ensure()
     thread_state = pyapi.save_thread()
@@ -137,20 +208,9 @@ def build_gufunc_kernel(library, ctx, info, sig, inner_ndim):
     if not isinstance(sig.return_type, types.NoneType):
         array_count += 1
 
-    parallel_for_ty = ir.FunctionType(ir.VoidType(),
-                                      [byte_ptr_t] * 5 + [intp_t, ] * 3)
     parallel_for = cgutils.get_or_insert_function(mod, parallel_for_ty,
                                                   'numba_parallel_for')
 
-    # Reference inner-function and link
-    innerfunc_fnty = ir.FunctionType(
-        ir.VoidType(),
-        [byte_ptr_ptr_t, intp_ptr_t, intp_ptr_t, byte_ptr_t],
-    )
-    tmp_voidptr = cgutils.get_or_insert_function(mod, innerfunc_fnty,
-                                                 info.name,)
-    wrapperlib.add_linking_library(info.library)
-
     get_num_threads = cgutils.get_or_insert_function(
         builder.module,
         ir.FunctionType(ir.IntType(types.intp.bitwidth), []),
@@ -191,8 +251,8 @@ class ParallelUFuncBuilder(ufuncbuilder.UFuncBuilder):
         info = build_ufunc_wrapper(library, ctx, fname, signature, cres)
         ptr = info.library.get_pointer_to_function(info.name)
         # Get dtypes
-        dtypenums = [np.dtype(a.name).num for a in signature.args]
-        dtypenums.append(np.dtype(signature.return_type.name).num)
+        dtypenums = [_get_dtype_num(a) for a in signature.args]
+        dtypenums.append(_get_dtype_num(signature.return_type))
         keepalive = ()
         return dtypenums, ptr, keepalive
 
@@ -201,8 +261,11 @@ def build_ufunc_wrapper(library, ctx, fname, signature, cres):
     innerfunc = ufuncbuilder.build_ufunc_wrapper(library, ctx, fname,
                                                  signature, objmode=False,
                                                  cres=cres)
+    # Each outer iteration of a ufunc is a single element, so small inputs
+    # are cheaper to process serially.
     info = build_gufunc_kernel(library, ctx, innerfunc, signature,
-                               len(signature.args))
+                               len(signature.args),
+                               serial_threshold=config.PARALLEL_UFUNC_THRESHOLD)
     return info
 
 # ---------------------------------------------------------------------------
@@ -243,7 +306,7 @@ class ParallelGUFuncBuilder(ufuncbuilder.GUFuncBuilder):
                 ty = a.dtype
             else:
                 ty = a
-            dtypenums.append(as_dtype(ty).num)
+            dtypenums.append(_get_dtype_num(ty))
 
         return dtypenums, ptr, env
 
@@ -263,9 +326,10 @@ def build_gufunc_wrapper(py_func, cres, sin, sout, cache, is_parfors):
     innerinfo = ufuncbuilder.build_gufunc_wrapper(
         py_func, cres, sin, sout, cache=cache, is_parfors=is_parfors,
     )
-    sym_in = set(sym for term in sin for sym in term)
-    sym_out = set(sym for term in sout for sym in term)
-    inner_ndim = len(sym_in | sym_out)
+    syms = set()
+    for term in (*sin, *sout):
+        syms.update(term)
+    inner_ndim = len(syms)
 
     info = build_gufunc_kernel(
         library, ctx, innerinfo, signature, inner_ndim,
@@ -375,56 +439,92 @@ def _check_tbb_version_compatible():
         raise ImportError("Problem with TBB. Reason: %s" % e)
 
 
+def _load_tbb():
+    try:
+        # check if TBB is present and compatible
+        _check_tbb_version_compatible()
+        # now try and load the backend
+        from numba.np.ufunc import tbbpool as lib
+    except ImportError:
+        return None
+    return lib
+
+
+def _load_omp():
+    # TODO: Check that if MKL is present that it is a version
+    # that understands GNU OMP might be present
+    try:
+        from numba.np.ufunc import omppool as lib
+    except ImportError:
+        return None
+    return lib
+
+
+def _load_workqueue():
+    # The workqueue is always built, failing to import it is an error
+    from numba.np.ufunc import workqueue as lib
+    return lib
+
+
+# Threading layer backend name -> loader returning the backend module, or
+# None if it is not available.
+_backend_loaders = {
+    'tbb': _load_tbb,
+    'omp': _load_omp,
+    'workqueue': _load_workqueue,
+}
+
+
+def _select_known_backend(backend):
+    """
+    Loads a specific threading layer backend based on string
+    """
+    try:
+        loader = _backend_loaders[backend]
+    except KeyError:
+        msg = "Unknown value specified for threading layer: %s"
+        raise ValueError(msg % backend)
+    return loader()
+
+
+def _select_from_backends(backends):
+    """
+    Selects from presented backends and returns the first working
+    """
+    for backend in backends:
+        lib = _select_known_backend(backend)
+        if lib is not None:
+            return lib, backend
+    return None, ''
+
+
+# Installation hints for missing threading layer dependencies, keyed by the
+# requirement names collected in _launch_threads.
+_err_helpers = {
+    'TBB': ("Intel TBB is required, try:\n"
+            "$ conda/pip install tbb"),
+    'OSX_OMP': ("Intel OpenMP is required, try:\n"
+                "$ conda/pip install intel-openmp"),
+}
+
+
 def _launch_threads():
+    global _is_initialized
+    # Fast path: once a threading layer is loaded there is nothing to do, so
+    # avoid acquiring the locks (the process lock may be a multiprocessing
+    # RLock, which costs a semaphore syscall). _is_initialized is only ever
+    # set to True, under both locks, so reading it unlocked is safe.
+    if _is_initialized:
+        return
+
     if not _backend_init_process_lock:
         _set_init_process_lock()
 
     with _backend_init_process_lock:
         with _backend_init_thread_lock:
-            global _is_initialized
             if _is_initialized:
                 return
 
-            def select_known_backend(backend):
-                """
-                Loads a specific threading layer backend based on string
-                """
-                lib = None
-                if backend.startswith("tbb"):
-                    try:
-                        # check if TBB is present and compatible
-                        _check_tbb_version_compatible()
-                        # now try and load the backend
-                        from numba.np.ufunc import tbbpool as lib
-                    except ImportError:
-                        pass
-                elif backend.startswith("omp"):
-                    # TODO: Check that if MKL is present that it is a version
-                    # that understands GNU OMP might be present
-                    try:
-                        from numba.np.ufunc import omppool as lib
-                    except ImportError:
-                        pass
-                elif backend.startswith("workqueue"):
-                    from numba.np.ufunc import workqueue as lib
-                else:
-                    msg = "Unknown value specified for threading layer: %s"
-                    raise ValueError(msg % backend)
-                return lib
-
-            def select_from_backends(backends):
-                """
-                Selects from presented backends and returns the first working
-                """
-                lib = None
-                for backend in backends:
-                    lib = select_known_backend(backend)
-                    if lib is not None:
-                        break
-                else:
-                    backend = ''
-                return lib, backend
-
             t = str(config.THREADING_LAYER).lower()
             namedbackends = config.THREADING_LAYER_PRIORITY
             if not (len(namedbackends) == 3 and
@@ -437,11 +537,6 @@ def _launch_threads():
                 )
 
             lib = None
-            err_helpers = dict()
-            err_helpers['TBB'] = ("Intel TBB is required, try:\n"
-                                  "$ conda/pip install tbb")
-            err_helpers['OSX_OMP'] = ("Intel OpenMP is required, try:\n"
-                                      "$ conda/pip install intel-openmp")
             requirements = []
 
             def raise_with_hint(required):
@@ -450,15 +545,16 @@ def _launch_threads():
                 if len(required) == 0:
                     hint = ''
                 if len(required) == 1:
-                    hint = hintmsg % err_helpers[required[0]]
+                    hint = hintmsg % _err_helpers[required[0]]
                 if len(required) > 1:
-                    options = '\nOR\n'.join([err_helpers[x] for x in required])
+                    options = '\nOR\n'.join([_err_helpers[x]
+                                             for x in required])
                     hint = hintmsg % ("One of:\n%s" % options)
                 raise ValueError(errmsg % hint)
 
             if t in namedbackends:
                 # Try and load the specific named backend
-                lib = select_known_backend(t)
+                lib = _select_known_backend(t)
                 if not lib:
                     # something is missing preventing a valid backend from
                     # loading, set requirements for hinting
@@ -493,11 +589,11 @@ def _launch_threads():
                     msg = "No threading layer available for purpose %s"
                     raise ValueError(msg % t)
                 # select amongst available
-                lib, libname = select_from_backends(available)
+                lib, libname = _select_from_backends(available)
             elif t == 'default':
                 # If default is supplied, try them in order, tbb, omp,
                 # workqueue
-                lib, libname = select_from_backends(namedbackends)
+                lib, libname = _select_from_backends(namedbackends)
                 if not lib:
                     # set requirements for hinting
                     requirements.append('TBB')
@@ -526,6 +622,23 @@ def _launch_threads():
             _is_initialized = True
 
 
+def _preload_threads():
+    """
+    Start initialising the threading layer in a background daemon thread, so
+    that it is ready by the time a parallel target is first used.
+    """
+    def preload():
+        try:
+            _launch_threads()
+        except Exception:
+            # Not fatal here, the problem is reported again (and raised) when
+            # a parallel target calls _launch_threads() itself.
+            pass
+
+    threading.Thread(target=preload, name='numba-threading-layer-preload',
+                     daemon=True).start()
+
+
 def _load_threading_functions(lib):
 
     ll.add_symbol('get_num_threads', lib.get_num_threads)
@@ -1,6 +1,7 @@
 from numba.np.ufunc.parallel import get_thread_count
 from os import environ as env
 from numba.core import config
+from numba.tests.support import run_in_subprocess
 import unittest
 
 
@@ -34,5 +35,23 @@ class TestParallelEnvVariable(unittest.TestCase):
             env[key] = current
             config.reload_config()
 
+    def test_parallel_preload_variable(self):
+        """
+        Tests NUMBA_PARALLEL_PRELOAD starts the threading layer at import.
+        """
+        code = (
+            "import numba, time\n"
+            "from numba.np.ufunc import parallel\n"
+            "for _ in range(100):\n"
+            "    if parallel._is_initialized:\n"
+            "        break\n"
+            "    time.sleep(0.1)\n"
+            "print(parallel._is_initialized)\n"
+        )
+        new_env = env.copy()
+        new_env['NUMBA_PARALLEL_PRELOAD'] = '1'
+        out, _ = run_in_subprocess(code, env=new_env)
+        self.assertEqual(out.decode().strip(), 'True')
+
 if __name__ == '__main__':
     unittest.main()
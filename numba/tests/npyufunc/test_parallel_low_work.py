@@ -6,6 +6,7 @@ import numpy as np
 
 from numba import float32, float64, int32, uint32
 from numba.np.ufunc import Vectorize
+from numba.tests.support import override_config
 import unittest
 
 
@@ -17,7 +18,7 @@ class TestParallelLowWorkCount(unittest.TestCase):
 
     _numba_parallel_test_ = False
 
-    def test_low_workcount(self):
+    def check_workcount(self, sizes):
         # build parallel native code ufunc
         pv = Vectorize(vector_add, target='parallel')
         for ty in (int32, uint32, float32, float64):
@@ -28,16 +29,27 @@ class TestParallelLowWorkCount(unittest.TestCase):
         np_ufunc = np.vectorize(vector_add)
 
         # test it out
-        def test(ty):
-            data = np.arange(1).astype(ty) # just one item
+        def test(ty, n):
+            data = np.arange(n).astype(ty)
             result = para_ufunc(data, data)
             gold = np_ufunc(data, data)
             np.testing.assert_allclose(gold, result)
 
-        test(np.double)
-        test(np.float32)
-        test(np.int32)
-        test(np.uint32)
+        for n in sizes:
+            test(np.double, n)
+            test(np.float32, n)
+            test(np.int32, n)
+            test(np.uint32, n)
+
+    def test_low_workcount(self):
+        # force dispatch to the threading layer, even for just one item
+        with override_config('PARALLEL_UFUNC_THRESHOLD', 0):
+            self.check_workcount([1])
+
+    def test_serial_threshold(self):
+        # sizes either side of the threshold under which ufuncs run serially
+        with override_config('PARALLEL_UFUNC_THRESHOLD', 16):
+            self.check_workcount([1, 15, 16, 17, 100])
 
 
 if __name__ == '__main__':
@@ -11,8 +11,16 @@ from numba import jit
 def fib1(n):
     if n < 2:
         return n
+    if n == 2:
+        return 1
+    # Fast doubling: F(2k) = F(k) * (2 * F(k + 1) - F(k)) and
+    # F(2k + 1) = F(k) ** 2 + F(k + 1) ** 2
     # Note the second call uses a named argument
-    return fib1(n - 1) + fib1(n=n - 2)
+    a = fib1(n >> 1)
+    b = fib1(n=(n >> 1) + 1)
+    if n & 1:
+        return a * a + b * b
+    return a * (2 * b - a)
 
 
 def make_fib2():
@@ -20,7 +28,15 @@ def make_fib2():
     def fib2(n):
         if n < 2:
             return n
-        return fib2(n - 1) + fib2(n=n - 2)
+        if n == 2:
+            return 1
+        # Fast doubling: F(2k) = F(k) * (2 * F(k + 1) - F(k)) and
+        # F(2k + 1) = F(k) ** 2 + F(k + 1) ** 2
+        a = fib2(n >> 1)
+        b = fib2(n=(n >> 1) + 1)
+        if n & 1:
+            return a * a + b * b
+        return a * (2 * b - a)
 
     return fib2
 
@@ -42,7 +58,15 @@ def make_type_change_self(jit=lambda x: x):
 def fib3(n):
     if n < 2:
         return n
-    return fib3(n - 1) + fib3(n - 2)
+    if n == 2:
+        return 1
+    # Fast doubling: F(2k) = F(k) * (2 * F(k + 1) - F(k)) and
+    # F(2k + 1) = F(k) ** 2 + F(k + 1) ** 2
+    a = fib3(n >> 1)
+    b = fib3((n >> 1) + 1)
+    if n & 1:
+        return a * a + b * b
+    return a * (2 * b - a)
 
 
 # Run-away self recursion
@@ -193,7 +193,7 @@ class TestArrayManipulation(MemoryLeakMixin, TestCase):
         pyfuncs_to_use = [array_reshape, numpy_array_reshape]
 
         def generic_run(pyfunc, arr, shape):
-            cres = compile_isolated(pyfunc, (typeof(arr), typeof(shape)))
+            cres = self.ccache.compile(pyfunc, (typeof(arr), typeof(shape)))
             return cres.entry_point(arr, shape)
 
         @from_generic(pyfuncs_to_use)
@@ -518,7 +518,7 @@ class TestArrayManipulation(MemoryLeakMixin, TestCase):
             arraytype1 = arraytype1.copy(layout='A')
 
         self.assertEqual(arraytype1.layout, layout)
-        cr = compile_isolated(pyfunc, (arraytype1,), flags=flags)
+        cr = self.ccache.compile(pyfunc, (arraytype1,), flags=flags)
         cfunc = cr.entry_point
 
         expected = pyfunc(a)
@@ -535,7 +535,7 @@ class TestArrayManipulation(MemoryLeakMixin, TestCase):
             # compile
             arraytype1 = typeof(a)
             self.assertEqual(arraytype1.layout, assume_layout)
-            cr = compile_isolated(pyfunc, (arraytype1,), flags=flags)
+            cr = self.ccache.compile(pyfunc, (arraytype1,), flags=flags)
             cfunc = cr.entry_point
 
             expected = pyfunc(a)
@@ -570,7 +570,7 @@ class TestArrayManipulation(MemoryLeakMixin, TestCase):
 
         pyfunc = ravel_array_size
         arraytype1 = typeof(a)
-        cr = compile_isolated(pyfunc, (arraytype1,), flags=flags)
+        cr = self.ccache.compile(pyfunc, (arraytype1,), flags=flags)
         cfunc = cr.entry_point
 
         expected = pyfunc(a)
@@ -589,7 +589,7 @@ class TestArrayManipulation(MemoryLeakMixin, TestCase):
             a = np.arange(9).reshape(3, 3)
 
             arraytype1 = typeof(a)
-            cr = compile_isolated(pyfunc, (arraytype1,), flags=flags)
+            cr = self.ccache.compile(pyfunc, (arraytype1,), flags=flags)
             cfunc = cr.entry_point
 
             expected = pyfunc(a)
@@ -606,7 +606,7 @@ class TestArrayManipulation(MemoryLeakMixin, TestCase):
 
         pyfunc = squeeze_array
         arraytype1 = typeof(a)
-        cr = compile_isolated(pyfunc, (arraytype1,), flags=flags)
+        cr = self.ccache.compile(pyfunc, (arraytype1,), flags=flags)
         cfunc = cr.entry_point
 
         expected = pyfunc(a)
@@ -624,7 +624,7 @@ class TestArrayManipulation(MemoryLeakMixin, TestCase):
 
         pyfunc = add_axis2
         arraytype1 = typeof(a)
-        cr = compile_isolated(pyfunc, (arraytype1,), flags=flags)
+        cr = self.ccache.compile(pyfunc, (arraytype1,), flags=flags)
         cfunc = cr.entry_point
 
         expected = pyfunc(a)
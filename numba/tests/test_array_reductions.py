@@ -1,3 +1,4 @@
+from functools import lru_cache
 from itertools import product, combinations_with_replacement
 
 import numpy as np
@@ -5,7 +6,8 @@ import numpy as np
 from numba import jit, typeof
 from numba.core.compiler import compile_isolated
 from numba.np.numpy_support import numpy_version
-from numba.tests.support import TestCase, MemoryLeakMixin, tag
+from numba.tests.support import (TestCase, MemoryLeakMixin, CompilationCache,
+                                 tag)
 import unittest
 
 
@@ -175,9 +177,16 @@ def full_test_arrays(dtype):
         assert a.dtype == np.dtype(dtype)
     return array_list
 
+# Shared by run_comparative() so that test arrays of the same type compile
+# each reduction once. Created on first use, so that importing this module
+# (e.g. to collect other tests) does not build the compiler contexts.
+@lru_cache(maxsize=None)
+def _get_ccache():
+    return CompilationCache()
+
 def run_comparative(compare_func, test_array):
     arrty = typeof(test_array)
-    cres = compile_isolated(compare_func, [arrty])
+    cres = _get_ccache().compile(compare_func, (arrty,))
     numpy_result = compare_func(test_array)
     numba_result = cres.entry_point(test_array)
 
@@ -1134,26 +1143,35 @@ class TestArrayReductions(MemoryLeakMixin, TestCase):
         def install_tests(dtypes, funcs):
             # Install tests on class
             for dt in dtypes:
-                test_arrays = full_test_arrays(dt)
-                for red_func, test_array in product(funcs, test_arrays):
+                # One test per dimensionality, covering all the test arrays
+                # of that dimensionality (these mostly share a type, and
+                # hence a compilation)
+                arrays_by_ndim = {}
+                for test_array in full_test_arrays(dt):
+                    arrays_by_ndim.setdefault(test_array.ndim,
+                                              []).append(test_array)
+                for red_func, test_arrays in product(funcs,
+                                                     arrays_by_ndim.values()):
                     # Create the name for the test function
                     test_name = "test_{0}_{1}_{2}d"
                     test_name = test_name.format(red_func.__name__,
-                                                 test_array.dtype.name,
-                                                 test_array.ndim)
+                                                 test_arrays[0].dtype.name,
+                                                 test_arrays[0].ndim)
 
                     def new_test_function(self, redFunc=red_func,
-                                          testArray=test_array,
+                                          testArrays=test_arrays,
                                           testName=test_name):
-                        ulps = 1
-                        if 'prod' in red_func.__name__ and \
-                            np.iscomplexobj(testArray):
-                            # prod family accumulate slightly more error on
-                            # some architectures (power, 32bit) for complex input
-                            ulps = 3
-                        npr, nbr = run_comparative(redFunc, testArray)
-                        self.assertPreciseEqual(npr, nbr, msg=testName,
-                                                prec="single", ulps=ulps)
+                        for testArray in testArrays:
+                            ulps = 1
+                            if 'prod' in redFunc.__name__ and \
+                                np.iscomplexobj(testArray):
+                                # prod family accumulate slightly more error
+                                # on some architectures (power, 32bit) for
+                                # complex input
+                                ulps = 3
+                            npr, nbr = run_comparative(redFunc, testArray)
+                            self.assertPreciseEqual(npr, nbr, msg=testName,
+                                                    prec="single", ulps=ulps)
 
                     # Install it into the class
                     setattr(cls, test_name, new_test_function)
@@ -105,6 +105,17 @@ class JITCPUCodegenTestCase(TestCase):
         cfunc = ctypes_sum_ty(ptr)
         self.assertEqual(cfunc(2, 3), 5)
 
+    def test_add_linking_library_once(self):
+        library = self.codegen.create_library('compiled_module')
+        library.add_llvm_module(ll.parse_assembly(asm_sum_outer))
+        linking_library = self.codegen.create_library('linking_module')
+        linking_library.add_llvm_module(ll.parse_assembly(asm_sum_inner))
+        library.add_linking_library(linking_library)
+        library.add_linking_library(linking_library)
+        self.assertEqual(library._linking_libraries, [linking_library])
+        cfunc = ctypes_sum_ty(library.get_pointer_to_function("sum"))
+        self.assertEqual(cfunc(2, 3), 5)
+
     def test_magic_tuple(self):
         tup = self.codegen.magic_tuple()
         pickle.dumps(tup)
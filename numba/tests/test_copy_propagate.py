@@ -4,9 +4,8 @@
 #
 
 from numba import jit, njit
-from numba.core import types, typing, ir, config, compiler, cpu
+from numba.core import types, typing, ir, compiler, cpu
 from numba.core.registry import cpu_target
-from numba.core.annotations import type_annotations
 from numba.core.ir_utils import (copy_propagate, apply_copy_propagate,
                             get_name_var_table)
 from numba.core.typed_passes import type_inference_stage
@@ -73,15 +72,6 @@ class TestCopyPropagate(unittest.TestCase):
                                                                       test_ir,
                                                                       args,
                                                                       None)
-            type_annotation = type_annotations.TypeAnnotation(
-                func_ir=test_ir,
-                typemap=typemap,
-                calltypes=calltypes,
-                lifted=(),
-                lifted_from=None,
-                args=args,
-                return_type=return_type,
-                html_output=config.HTML)
             in_cps, out_cps = copy_propagate(test_ir.blocks, typemap)
             apply_copy_propagate(test_ir.blocks, in_cps,
                                  get_name_var_table(test_ir.blocks), typemap,
@@ -102,15 +92,6 @@ class TestCopyPropagate(unittest.TestCase):
                                                                       test_ir,
                                                                       args,
                                                                       None)
-            type_annotation = type_annotations.TypeAnnotation(
-                func_ir=test_ir,
-                typemap=typemap,
-                calltypes=calltypes,
-                lifted=(),
-                lifted_from=None,
-                args=args,
-                return_type=return_type,
-                html_output=config.HTML)
             in_cps, out_cps = copy_propagate(test_ir.blocks, typemap)
             apply_copy_propagate(test_ir.blocks, in_cps, get_name_var_table(test_ir.blocks), typemap, calltypes)
 
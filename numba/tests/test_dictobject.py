@@ -65,6 +65,37 @@ class TestDictObject(MemoryLeakMixin, TestCase):
         # Insert 100 entries
         self.assertEqual(foo(n=100), 100)
 
+    def test_dict_create_n_keys(self):
+        """
+        Exercise dictionary creation with a preallocated capacity
+        """
+        @njit
+        def foo(n_keys, n):
+            d = dictobject.new_dict(int32, float32, n_keys=n_keys)
+            for i in range(n):
+                d[i] = i + 1
+            total = 0
+            for v in d.values():
+                total += v
+            return len(d), total
+
+        # Preallocate nothing
+        self.assertEqual(foo(n_keys=0, n=10), (10, 55))
+        # Preallocate exactly
+        self.assertEqual(foo(n_keys=100, n=100), (100, 5050))
+        # Preallocate too little, the dict must still grow
+        self.assertEqual(foo(n_keys=10, n=100), (100, 5050))
+
+    def test_dict_create_n_keys_negative(self):
+        @njit
+        def foo(n_keys):
+            return dictobject.new_dict(int32, float32, n_keys=n_keys)
+
+        with self.assertRaises(RuntimeError) as raises:
+            foo(-1)
+        self.assertIn("expecting *n_keys* to be >= 0",
+                      str(raises.exception))
+
     def test_dict_get(self):
         """
         Exercise dictionary creation, insertion and get
@@ -502,6 +533,28 @@ class TestDictObject(MemoryLeakMixin, TestCase):
         out = foo(keys, vals)
         self.assertEqual(out, list(zip(keys, vals)))
 
+    def test_dict_copy_after_delete(self):
+        """
+        Exercise dict.copy on a dict with deleted entries
+        """
+        @njit
+        def foo(n, ndel):
+            d = dictobject.new_dict(int32, float64)
+            for i in range(n):
+                d[i] = i / 10
+            for i in range(ndel):
+                del d[i]
+            c = d.copy()
+            # the copy must be independent from the original
+            c[n] = -1.
+            return list(c.items()), len(d)
+
+        for ndel in (0, 1, 10, 19):
+            items, n_orig = foo(20, ndel)
+            expect = [(i, i / 10) for i in range(ndel, 20)] + [(20, -1.)]
+            self.assertEqual(items, expect)
+            self.assertEqual(n_orig, 20 - ndel)
+
     def test_dict_setdefault(self):
         """
         Exercise dict.setdefault
@@ -1130,6 +1183,23 @@ class TestTypedDict(MemoryLeakMixin, TestCase):
         self.assertEqual(copied, d)
         self.assertEqual(list(copied.items()), list(d.items()))
 
+    def test_empty_n_keys(self):
+        d = Dict.empty(int32, float32, n_keys=100)
+        self.assertEqual(len(d), 0)
+        for i in range(100):
+            d[i] = i
+        self.assertEqual(len(d), 100)
+        self.assertEqual(list(d.keys()), list(range(100)))
+
+        @njit
+        def foo(n_keys):
+            d = Dict.empty(int32, float32, n_keys=n_keys)
+            for i in range(n_keys):
+                d[i] = i
+            return len(d)
+
+        self.assertEqual(foo(100), 100)
+
     def test_copy_from_dict(self):
         expect = {k: float(v) for k, v in zip(range(10), range(10, 20))}
         nbd = Dict.empty(int32, float64)
@@ -1218,6 +1288,24 @@ class TestDictRefctTypes(MemoryLeakMixin, TestCase):
             self.assertEqual(d[str(i)], i)
         self.assertEqual(dict(d), expect)
 
+    def test_str_key_copy(self):
+        @njit
+        def foo():
+            d = Dict.empty(
+                key_type=types.unicode_type,
+                value_type=types.unicode_type,
+            )
+            for i in range(10):
+                d[str(i)] = str(i * 2)
+            del d["3"]
+            c = d.copy()
+            d.clear()
+            return c
+
+        c = foo()
+        expect = {str(i): str(i * 2) for i in range(10) if i != 3}
+        self.assertEqual(dict(c), expect)
+
     def test_str_val(self):
         @njit
         def foo():
@@ -1,5 +1,6 @@
 import ctypes
 import ctypes.util
+import functools
 import os
 import sys
 import threading
@@ -65,6 +66,15 @@ def object_f(a, indices):
         a[idx] = PyThread_get_thread_ident()
 
 
+@functools.lru_cache(maxsize=None)
+def compile_f(nogil):
+    """
+    Compile f() in nopython mode. Several tests use the same
+    specializations, so they are compiled once.
+    """
+    return jit(f_sig, nopython=True, nogil=nogil)(f)
+
+
 class TestGILRelease(TestCase):
 
     def make_test_array(self, n_members):
@@ -114,16 +124,14 @@ class TestGILRelease(TestCase):
         Test the GIL is held by default, by checking serialized runs
         produce deterministic results.
         """
-        cfunc = jit(f_sig, nopython=True)(f)
-        self.check_gil_held(cfunc)
+        self.check_gil_held(compile_f(nogil=False))
 
     def test_gil_released(self):
         """
         Test releasing the GIL, by checking parallel runs produce
         unpredictable results.
         """
-        cfunc = jit(f_sig, nopython=True, nogil=True)(f)
-        self.check_gil_released(cfunc)
+        self.check_gil_released(compile_f(nogil=True))
 
     def test_gil_released_inside_lifted_loop(self):
         """
@@ -138,7 +146,7 @@ class TestGILRelease(TestCase):
         Releasing the GIL in the caller is sufficient to have it
         released in a callee.
         """
-        compiled_f = jit(f_sig, nopython=True)(f)
+        compiled_f = compile_f(nogil=False)
         @jit(f_sig, nopython=True, nogil=True)
         def caller(a, i):
             compiled_f(a, i)
@@ -148,7 +156,7 @@ class TestGILRelease(TestCase):
         """
         Same, but with both caller and callee asking to release the GIL.
         """
-        compiled_f = jit(f_sig, nopython=True, nogil=True)(f)
+        compiled_f = compile_f(nogil=True)
         @jit(f_sig, nopython=True, nogil=True)
         def caller(a, i):
             compiled_f(a, i)
@@ -158,7 +166,7 @@ class TestGILRelease(TestCase):
         """
         When only the callee asks to release the GIL, it gets ignored.
         """
-        compiled_f = jit(f_sig, nopython=True, nogil=True)(f)
+        compiled_f = compile_f(nogil=True)
         @jit(f_sig, nopython=True)
         def caller(a, i):
             compiled_f(a, i)
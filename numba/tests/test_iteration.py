@@ -153,16 +153,18 @@ class IterationTest(MemoryLeakMixin, TestCase):
     def test_array_1d_complex_npm(self):
         self.test_array_1d_complex(no_pyobj_flags)
 
+    def make_record_array(self):
+        a = np.arange(3, dtype=np.float64) * 2
+        b = np.arange(3, dtype=np.int32) + 2
+        return np.rec.fromarrays([a, b], dtype=record_dtype)
+
     def test_array_1d_record(self, flags=force_pyobj_flags):
         pyfunc = record_iter_usecase
         item_type = numpy_support.from_dtype(record_dtype)
         cr = compile_isolated(pyfunc, (types.Array(item_type, 1, 'A'),),
                               flags=flags)
         cfunc = cr.entry_point
-        arr = np.recarray(3, dtype=record_dtype)
-        for i in range(3):
-            arr[i].a = float(i * 2)
-            arr[i].b = i + 2
+        arr = self.make_record_array()
         got = pyfunc(arr)
         self.assertPreciseEqual(cfunc(arr), got)
 
@@ -175,10 +177,7 @@ class IterationTest(MemoryLeakMixin, TestCase):
         cr = compile_isolated(pyfunc, (types.Array(item_type, 1, 'A'),),
                               flags=flags)
         cfunc = cr.entry_point
-        arr = np.recarray(3, dtype=record_dtype)
-        for i in range(3):
-            arr[i].a = float(i * 2)
-            arr[i].b = i + 2
+        arr = self.make_record_array()
         expected = arr.copy()
         pyfunc(expected)
         got = arr.copy()
@@ -83,7 +83,9 @@ class RefRecorder(object):
         """
         count = self._counts[event] + 1
         self._counts[event] = count
-        self._events.append(event.format(count=count))
+        if '{' in event:
+            event = event.format(count=count)
+        self._events.append(event)
 
     def _on_disposal(self, wr):
         name = self._wrs.pop(wr)
@@ -227,6 +227,38 @@ class TestTypedList(MemoryLeakMixin, TestCase):
         val = consumer(l)
         self.assertEqual(val, 23)
 
+    def test_index_bounds(self):
+        """ Test the bounds check on integer indices.
+
+        Negative indices are wrapped before the check, which must accept
+        exactly [-len, len) for getitem, setitem and pop.
+
+        """
+        tl = to_tl([10, 11, 12])
+
+        # negative indices that wrap into range
+        self.assertEqual(tl[-1], 12)
+        self.assertEqual(tl[-3], 10)
+        tl[-3] = 20
+        self.assertEqual(list(tl), [20, 11, 12])
+        self.assertEqual(tl.pop(-1), 12)
+        tl.append(12)
+
+        # negative indices below -len, and index == len
+        for index in (-4, -100, 3):
+            with self.assertRaises(IndexError) as raises:
+                tl[index]
+            self.assertIn("list index out of range", str(raises.exception))
+            with self.assertRaises(IndexError) as raises:
+                tl[index] = 0
+            self.assertIn("list index out of range", str(raises.exception))
+            with self.assertRaises(IndexError) as raises:
+                tl.pop(index)
+            self.assertIn("list index out of range", str(raises.exception))
+
+        # the failed accesses left the list untouched
+        self.assertEqual(list(tl), [20, 11, 12])
+
     def test_getitem_slice(self):
         """ Test getitem using a slice.
 
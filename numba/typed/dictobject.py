@@ -69,13 +69,16 @@ class Status(IntEnum):
     ERR_CMP_FAILED = -5
 
 
-def new_dict(key, value):
+def new_dict(key, value, n_keys=0):
     """Construct a new dict.
 
     Parameters
     ----------
     key, value : TypeRef
         Key type and value type of the new dict.
+    n_keys : int, default 0
+        The number of keys to insert without needing to resize.
+        A value of 0 creates a dict with minimum size.
     """
     # With JIT disabled, ignore all arguments and return a Python dict.
     return dict()
@@ -212,27 +215,32 @@ def _imp_dtor(context, module):
 
 
 @intrinsic
-def _dict_new_minsize(typingctx, keyty, valty):
-    """Wrap numba_dict_new_minsize.
+def _dict_new_sized(typingctx, n_keys, keyty, valty):
+    """Wrap numba_dict_new_sized.
 
-    Allocate a new dictionary object with the minimum capacity.
+    Allocate a new dictionary object with enough space to hold
+    *n_keys* keys without needing a resize.
 
     Parameters
     ----------
+    n_keys: int
+        The number of keys to insert without needing a resize.
+        A value of 0 creates a dict with minimum size.
     keyty, valty: Type
         Type of the key and value, respectively.
 
     """
     resty = types.voidptr
-    sig = resty(keyty, valty)
+    sig = resty(types.intp, keyty, valty)
 
     def codegen(context, builder, sig, args):
+        [n_keys, _, _] = args
         fnty = ir.FunctionType(
             ll_status,
-            [ll_dict_type.as_pointer(), ll_ssize_t, ll_ssize_t],
+            [ll_dict_type.as_pointer(), ll_ssize_t, ll_ssize_t, ll_ssize_t],
         )
         fn = cgutils.get_or_insert_function(builder.module, fnty,
-                                            'numba_dict_new_minsize')
+                                            'numba_dict_new_sized')
         # Determine sizeof key and value types
         ll_key = context.get_data_type(keyty.instance_type)
         ll_val = context.get_data_type(valty.instance_type)
@@ -241,7 +249,7 @@ def _dict_new_minsize(typingctx, keyty, valty):
         refdp = cgutils.alloca_once(builder, ll_dict_type, zfill=True)
         status = builder.call(
             fn,
-            [refdp, ll_ssize_t(sz_key), ll_ssize_t(sz_val)],
+            [refdp, n_keys, ll_ssize_t(sz_key), ll_ssize_t(sz_val)],
         )
         _raise_if_error(
             context, builder, status,
@@ -253,6 +261,36 @@ def _dict_new_minsize(typingctx, keyty, valty):
     return sig, codegen
 
 
+@intrinsic
+def _dict_copy(typingctx, d):
+    """Wrap numba_dict_copy.
+
+    Allocate a new dictionary object holding the same items as *d*.
+    """
+    resty = types.voidptr
+    sig = resty(d)
+
+    def codegen(context, builder, sig, args):
+        fnty = ir.FunctionType(
+            ll_status,
+            [ll_dict_type.as_pointer(), ll_dict_type],
+        )
+        fn = cgutils.get_or_insert_function(builder.module, fnty,
+                                            'numba_dict_copy')
+        [d] = args
+        [td] = sig.args
+        dp = _container_get_data(context, builder, td, d)
+        refdp = cgutils.alloca_once(builder, ll_dict_type, zfill=True)
+        status = builder.call(fn, [refdp, dp])
+        _raise_if_error(
+            context, builder, status,
+            msg="Failed to allocate dictionary",
+        )
+        return builder.load(refdp)
+
+    return sig, codegen
+
+
 @intrinsic
 def _dict_set_method_table(typingctx, dp, keyty, valty):
     """Wrap numba_dict_set_method_table
@@ -644,9 +682,11 @@ def _make_dict(typingctx, keyty, valty, ptr):
 
 
 @overload(new_dict)
-def impl_new_dict(key, value):
+def impl_new_dict(key, value, n_keys=0):
     """Creates a new dictionary with *key* and *value* as the type
-    of the dictionary key and value, respectively.
+    of the dictionary key and value, respectively. *n_keys* is the
+    number of keys to insert without requiring a resize, where a
+    value of 0 creates a dictionary with minimum size.
     """
     if any([
         not isinstance(key, Type),
@@ -654,10 +694,15 @@ def impl_new_dict(key, value):
     ]):
         raise TypeError("expecting *key* and *value* to be a numba Type")
 
+    if not isinstance(n_keys, (int, types.Integer)):
+        raise TypeError("expecting *n_keys* to be an integer")
+
     keyty, valty = key, value
 
-    def imp(key, value):
-        dp = _dict_new_minsize(keyty, valty)
+    def imp(key, value, n_keys=0):
+        if n_keys < 0:
+            raise RuntimeError("expecting *n_keys* to be >= 0")
+        dp = _dict_new_sized(n_keys, keyty, valty)
         _dict_set_method_table(dp, keyty, valty)
         d = _make_dict(keyty, valty, dp)
         return d
@@ -857,10 +902,8 @@ def impl_copy(d):
     key_type, val_type = d.key_type, d.value_type
 
     def impl(d):
-        newd = new_dict(key_type, val_type)
-        for k, v in d.items():
-            newd[k] = v
-        return newd
+        dp = _dict_copy(d)
+        return _make_dict(key_type, val_type, dp)
 
     return impl
 
@@ -648,6 +648,21 @@ def fix_index(tyctx, list_ty, index_ty):
     return sig, codegen
 
 
+@intrinsic
+def _index_out_of_range(tyctx, index_ty, length_ty):
+    """Check that *index* is outside of [0, *length*).
+
+    Both are compared as unsigned integers, so that a negative index wraps to
+    a value larger than any length and a single comparison checks both bounds.
+    """
+    sig = types.boolean(types.intp, types.intp)
+
+    def codegen(context, builder, sig, args):
+        [index, length] = args
+        return builder.icmp_unsigned('>=', index, length)
+    return sig, codegen
+
+
 @register_jitable
 def handle_index(l, index):
     """Handle index.
@@ -658,7 +673,7 @@ def handle_index(l, index):
     # convert negative indices to positive ones
     index = fix_index(l, index)
     # check that the index is in range
-    if index < 0 or index >= len(l):
+    if _index_out_of_range(index, len(l)):
         raise IndexError("list index out of range")
     return index
 
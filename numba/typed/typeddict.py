@@ -19,8 +19,9 @@ from numba.core.typing import signature
 
 
 @njit
-def _make_dict(keyty, valty):
-    return dictobject._as_meminfo(dictobject.new_dict(keyty, valty))
+def _make_dict(keyty, valty, n_keys=0):
+    return dictobject._as_meminfo(dictobject.new_dict(keyty, valty,
+                                                      n_keys=n_keys))
 
 
 @njit
@@ -84,21 +85,23 @@ class Dict(MutableMapping):
     Implements the MutableMapping interface.
     """
 
-    def __new__(cls, dcttype=None, meminfo=None):
+    def __new__(cls, dcttype=None, meminfo=None, n_keys=0):
         if config.DISABLE_JIT:
             return dict.__new__(dict)
         else:
             return object.__new__(cls)
 
     @classmethod
-    def empty(cls, key_type, value_type):
+    def empty(cls, key_type, value_type, n_keys=0):
         """Create a new empty Dict with *key_type* and *value_type*
         as the types for the keys and values of the dictionary respectively.
+        Optionally, allocate enough memory to hold *n_keys* without requiring
+        resizes. The default value of 0 returns a dict with minimum size.
         """
         if config.DISABLE_JIT:
             return dict()
         else:
-            return cls(dcttype=DictType(key_type, value_type))
+            return cls(dcttype=DictType(key_type, value_type), n_keys=n_keys)
 
     def __init__(self, **kwargs):
         """
@@ -111,20 +114,24 @@ class Dict(MutableMapping):
             Used internally for the dictionary type.
         meminfo : MemInfo; keyword-only
             Used internally to pass the MemInfo object when boxing.
+        n_keys: int; keyword-only
+            The number of keys to insert without needing to resize.
+            A value of 0 creates a dict with minimum size.
         """
         if kwargs:
             self._dict_type, self._opaque = self._parse_arg(**kwargs)
         else:
             self._dict_type = None
 
-    def _parse_arg(self, dcttype, meminfo=None):
+    def _parse_arg(self, dcttype, meminfo=None, n_keys=0):
         if not isinstance(dcttype, DictType):
             raise TypeError('*dcttype* must be a DictType')
 
         if meminfo is not None:
             opaque = meminfo
         else:
-            opaque = _make_dict(dcttype.key_type, dcttype.value_type)
+            opaque = _make_dict(dcttype.key_type, dcttype.value_type,
+                                n_keys=n_keys)
         return dcttype, opaque
 
     @property
@@ -209,12 +216,12 @@ class Dict(MutableMapping):
 
 
 @overload_classmethod(types.DictType, 'empty')
-def typeddict_empty(cls, key_type, value_type):
+def typeddict_empty(cls, key_type, value_type, n_keys=0):
     if cls.instance_type is not DictType:
         return
 
-    def impl(cls, key_type, value_type):
-        return dictobject.new_dict(key_type, value_type)
+    def impl(cls, key_type, value_type, n_keys=0):
+        return dictobject.new_dict(key_type, value_type, n_keys=n_keys)
 
     return impl
 